@@ -150,6 +150,12 @@ def fvs_partition(
         Dict of keyword arguments passed to pandas.to_datetime_ to
         read datafile dates and time. Generally needed only if a
         nonstandard format is used in the datafile.
+    hfd_format["float_dtype"] : numpy float dtype
+        If given, series data are cast to this dtype after being read
+        and converted to SI units. Use ``np.float32`` to halve the
+        memory held by long data intervals. (Co)variances are still
+        computed in float64, but the stored series carry only float32
+        precision. Default is None (dtypes as read).
     hfd_format[ other keys ]
         when `hfd_format["filetype"]` is "csv" or "ghg", all other
         key:value pairs in `hfd_format` are passed as keyword arguments
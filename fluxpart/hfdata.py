@@ -37,6 +37,8 @@ class TooFewDataError(Error):
 
 VAR_NAMES = ["u", "v", "w", "c", "q", "T", "P"]
 
+_TOB1_EPOCH = np.datetime64("1990-01-01", "ns")
+
 _badfiletype = "File type not recognized ({})"
 _toofewdata_rel = "data frac = {frac:.4} < rd_tol = {rd_tol:.4}"
 _toofewdata_abs = "data length = {N} < ad_tol = {ad_tol}"
@@ -99,20 +101,34 @@ class HFData(object):
 
         # 1D mask is True for a row if any data are nan, any flag is
         # True, or any data are out-of-bounds
-        varindx = pd.Index(VAR_NAMES)
-        mask = data.loc[:, varindx].isnull().any(axis=1)
-        mask |= data.loc[:, data.columns.difference(varindx)].any(axis=1)
-        for var, (low, high) in bounds.items():
-            mask |= (data[var] < low) | (data[var] > high)
+        vals = data.loc[:, VAR_NAMES].to_numpy(dtype=float)
+        mask = np.isnan(vals).any(axis=1)
+        flagcols = data.columns.difference(VAR_NAMES)
+        if len(flagcols) > 0:
+            mask |= data.loc[:, flagcols].to_numpy(dtype=bool).any(axis=1)
+        if bounds:
+            indx = [VAR_NAMES.index(var) for var in bounds]
+            lows, highs = np.array(list(bounds.values()), dtype=float).T
+            bvals = vals[:, indx]
+            mask |= ((bvals < lows) | (bvals > highs)).any(axis=1)
         if isinstance(data.index, pd.DatetimeIndex) and data.shape[0] > 1:
             diff = data.index.to_series().diff()
-            mask |= (abs((diff / diff.mode()[0]) - 1) > .0001)
+            mask |= (abs((diff / diff.mode()[0]) - 1) > .0001).to_numpy()
 
         # Find longest span of valid (unmasked) data
-        marray = np.ma.array(np.zeros([data.shape[0]]), mask=mask.values)
-        unmasked_slices = np.ma.clump_unmasked(marray) or [slice(0, 0)]
-        max_indx = np.argmax([s.stop - s.start for s in unmasked_slices])
-        max_slice = unmasked_slices[max_indx]
+        if not mask.any():
+            max_slice = slice(0, data.shape[0])
+        else:
+            edges = np.diff(np.concatenate(([1], mask.view(np.int8), [1])))
+            starts = np.flatnonzero(edges == -1)
+            stops = np.flatnonzero(edges == 1)
+            if starts.size == 0:
+                max_slice = slice(0, 0)
+            else:
+                max_indx = np.argmax(stops - starts)
+                max_slice = slice(
+                    int(starts[max_indx]), int(stops[max_indx])
+                )
         len_max_slice = max_slice.stop - max_slice.start
 
         # verify sufficient data length
@@ -139,13 +155,16 @@ class HFData(object):
         """
         if self._already_corrected_external:
             return
-        ave_vapor = self["q"].mean()
-        ave_co2 = self["c"].mean()
-        ave_T = self["T"].mean()
-        dev_vapor = self["q"] - ave_vapor
-        dev_T = self["T"] - ave_T
-
-        Pdryair = self["P"].mean() - ave_vapor * GC.vapor * ave_T
+        q = self["q"].to_numpy()
+        c = self["c"].to_numpy()
+        T = self["T"].to_numpy()
+        ave_vapor = q.mean()
+        ave_co2 = c.mean()
+        ave_T = T.mean()
+        dev_vapor = q - ave_vapor
+        dev_T = T - ave_T
+
+        Pdryair = self["P"].to_numpy().mean() - ave_vapor * GC.vapor * ave_T
         rho_totair = ave_vapor + Pdryair / GC.dryair / ave_T
 
         specific_vapor = ave_vapor / rho_totair
@@ -154,8 +173,19 @@ class HFData(object):
         muq = mu * specific_vapor
         muc = mu * specific_co2
 
-        self["q"] += muq * dev_vapor + (1 + muq) * ave_vapor * dev_T / ave_T
-        self["c"] += muc * dev_vapor + (1 + muq) * ave_co2 * dev_T / ave_T
+        # scale factors are combined so each series is traversed once,
+        # and one scratch buffer is shared by the q and c updates
+        kq = (1 + muq) * ave_vapor / ave_T
+        kc = (1 + muq) * ave_co2 / ave_T
+        scratch = np.empty_like(dev_vapor)
+        corr_q = np.multiply(dev_T, kq)
+        corr_q += np.multiply(dev_vapor, muq, out=scratch)
+        corr_q += q
+        corr_c = np.multiply(dev_T, kc)
+        corr_c += np.multiply(dev_vapor, muc, out=scratch)
+        corr_c += c
+        self["q"] = corr_q
+        self["c"] = corr_c
         self._already_corrected_external = True
         return
 
@@ -167,7 +197,8 @@ class HFData(object):
         :class:`~fluxpart.hfdata.HFSummary`
 
         """
-        hfs = util.stats2(self.dataframe, VAR_NAMES)
+        data = self.dataframe.loc[:, VAR_NAMES].to_numpy(dtype=float)
+        hfs = util.stats2(data, VAR_NAMES)
         Pvap = hfs.ave_q * GC.vapor * hfs.ave_T
         rho_dryair = (hfs.ave_P - Pvap) / GC.dryair / hfs.ave_T
         rho_totair = rho_dryair + hfs.ave_q
@@ -196,7 +227,7 @@ class HFData(object):
 
     def truncate_pow2(self):
         """Truncate dataframe length to largest possible power of 2."""
-        truncate_len = 2 ** int(np.log2(self.dataframe.shape[0]))
+        truncate_len = 1 << (self.dataframe.shape[0].bit_length() - 1)
         self.dataframe = self.dataframe.iloc[:truncate_len]
 
 
@@ -226,6 +257,12 @@ class HFDataSource(object):
         records. Each tuple is of the form (col, goodval), where col is
         an int specifying the column number (0-based indexing), and
         goodval is the flag value indicating a good data record.
+    float_dtype : numpy float dtype, optional
+        If given, the u, v, w, c, q, T, and P data are cast to this
+        dtype after unit conversion. ``float_dtype=np.float32`` halves
+        the memory held by the series dataframe. Statistics and
+        (co)variances are still computed in float64. Default is None
+        (dtypes as read).
     **kwargs
         Passed to pandas.read_csv_ when filetype is csv or ghg. Should
         not include `usecols` or `header` keywords.
@@ -244,6 +281,7 @@ class HFDataSource(object):
         converters=None,
         time_col=None,
         flags=None,
+        float_dtype=None,
         **kwargs,
     ):
         if flags is None:
@@ -257,16 +295,12 @@ class HFDataSource(object):
         self._converters = {} if converters is None else converters
         self._time_col = time_col
         self._flags = flags
+        self._float_dtype = float_dtype
         self._csv_kws = kwargs
         self._dt_kws = self._csv_kws.pop("to_datetime_kws", {})
 
-    @property
-    def _names(self):
-        # sorted because pd.read_csv sorts usecols but not names
-        return sorted(self._namecols, key=self._namecols.get)
-
-    @property
-    def _namecols(self):
+        # Column layout is fixed by the initializer args, so it is
+        # computed once here rather than on every file read
         namecols = dict(zip(VAR_NAMES, self._cols))
         flags = {"flag-" + str(col): col for col, val in self._flags}
         namecols.update(flags)
@@ -276,7 +310,10 @@ class HFDataSource(object):
                 namecols["Time"] = self._time_col[1]
             except TypeError:
                 namecols["Datetime"] = self._time_col
-        return namecols
+        self._namecols = namecols
+        # sorted because pd.read_csv sorts usecols but not names
+        self._names = sorted(namecols, key=namecols.get)
+        self._usecols = [namecols[k] for k in self._names]
 
     def reader(self, interval, **kwargs):
         """Consume data source and yield in chunks of the time interval.
@@ -315,7 +352,7 @@ class HFDataSource(object):
 
         if self._filetype in ("csv", "ghg"):
             kws = {**self._csv_kws, **kwargs}
-            kws["usecols"] = self._usecols
+            kws["usecols"] = set(self._usecols)
             kws["header"] = None
             if self._filetype == "csv":
                 dfs = util.multifile_read_csv(self._files, **kws)
@@ -328,7 +365,8 @@ class HFDataSource(object):
             indx_dfs = (self._set_indices_tob1(df) for df in dfs)
 
         si_dfs = (self._set_units(df) for df in indx_dfs)
-        hf_dfs = (self._set_flags(df) for df in si_dfs)
+        typed_dfs = (self._set_dtype(df) for df in si_dfs)
+        hf_dfs = (self._set_flags(df) for df in typed_dfs)
         try:
             yield from util.chunked_df(hf_dfs, interval)
         except StopIteration:
@@ -350,51 +388,57 @@ class HFDataSource(object):
         return df.set_index("Datetime")
 
     def _set_indices_tob1(self, df):
-        df["Datetime"] = pd.to_datetime(
-            arg=df.loc[:, "SECONDS"] + 10 ** -9 * df.loc[:, "NANOSECONDS"],
-            unit="s",
-            origin="1990-01-01",
+        # Integer ns since the TOB1 epoch; avoids a float round trip
+        nsecs = df["SECONDS"].to_numpy(dtype=np.int64) * 10 ** 9
+        nsecs += df["NANOSECONDS"].to_numpy(dtype=np.int64)
+        datetime = _TOB1_EPOCH + nsecs.astype("timedelta64[ns]")
+        cols = zip(self._names, self._usecols)
+        return pd.DataFrame(
+            {name: df.iloc[:, col].to_numpy() for name, col in cols},
+            index=pd.DatetimeIndex(datetime, name="Datetime"),
         )
-        df = df.set_index("Datetime")
-        df = df.iloc[:, self._usecols]
-        df.columns = self._names
-        return df
 
     def _set_flags(self, df):
-        for col, val in self._flags:
-            df.loc[:, "flag-" + str(col)] = (
-                df.loc[:, "flag-" + str(col)] != val
-            )
+        if not self._flags:
+            return df
+        flags = ["flag-" + str(col) for col, val in self._flags]
+        # object dtype so that mixed (e.g., int and str) good values are
+        # not coerced to a common type before the compare
+        goodvals = np.array([val for col, val in self._flags], dtype=object)
+        df[flags] = df.loc[:, flags].to_numpy() != goodvals
         return df
 
+    def _set_dtype(self, df):
+        if self._float_dtype is None:
+            return df
+        return df.astype({var: self._float_dtype for var in VAR_NAMES})
+
     def _set_units(self, df):
         conc_are_mole_ratios = False
         for var, func in self._converters.items():
             if callable(func):
-                df.loc[:, var] = func(df.loc[:, var])
+                df[var] = func(df[var].to_numpy())
             else:
                 conc_are_mole_ratios = True
         if conc_are_mole_ratios:
             q_units = self._converters["q"]
             c_units = self._converters["c"]
-            p = df.loc[:, "P"]
-            t = df.loc[:, "T"]
+            p = df["P"].to_numpy()
+            t = df["T"].to_numpy()
             coef = 1e3 if q_units[:3] == "ppt" else 1e6
-            q_mole_ratio = df.loc[:, "q"] / coef
-            df.loc[:, "q"] = q_mole_ratio * p / GC.vapor / t
+            q_mole_ratio = df["q"].to_numpy() / coef
+            rho_q = q_mole_ratio * p / GC.vapor / t
             coef = 1e3 if c_units[:3] == "ppt" else 1e6
-            c_mole_ratio = df.loc[:, "c"] / coef
-            df.loc[:, "c"] = c_mole_ratio * p / GC.co2 / t
+            c_mole_ratio = df["c"].to_numpy() / coef
+            rho_c = c_mole_ratio * p / GC.co2 / t
             if c_units[-3:] == "dry":
-                df.loc[:, "c"] /= 1 + q_mole_ratio
+                rho_c /= 1 + q_mole_ratio
             if q_units[-3:] == "dry":
-                df.loc[:, "q"] /= 1 + q_mole_ratio
+                rho_q /= 1 + q_mole_ratio
+            df["q"] = rho_q
+            df["c"] = rho_c
         return df
 
-    @property
-    def _usecols(self):
-        return [self._namecols[k] for k in self._names]
-
 
 @attr.s
 class HFSummary(object):
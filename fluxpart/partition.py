@@ -47,9 +47,10 @@ def fvspart_progressive(w, q, c, wue, adjust_fluxes=True):
     `wqc_data` correspond to the final iteration attempted.
 
     """
-    max_decomp_lvl = int(np.log2(w.size))
-    wq_tot = np.cov((w, q))[0, 1]
-    wc_tot = np.cov((w, c))[0, 1]
+    max_decomp_lvl = w.size.bit_length() - 1
+    if adjust_fluxes:
+        wq_tot = _cov(w, q)
+        wc_tot = _cov(w, c)
 
     # The loop progressively filters the data until a physically valid
     # partitioning is found or the loop/filter is exhausted. The first
@@ -57,10 +58,10 @@ def fvspart_progressive(w, q, c, wue, adjust_fluxes=True):
     # (q'=q-<q>, etc.), so the first iteration uses the "unfiltered"
     # deviations.
 
-    for cnt, lowcut_wqc in enumerate(_progressive_lowcut(w, q, c)):
+    for cnt, lowcut_moments in enumerate(_progressive_lowcut(w, q, c)):
         wave_lvl = (max_decomp_lvl - cnt, max_decomp_lvl)
 
-        fluxes, fvsp = fvspart_series(*lowcut_wqc, wue)
+        fluxes, fvsp = fvspart_interval(_wqc_data(*lowcut_moments), wue)
         if cnt == 0:
             if fvsp.fvsp_mssg:
                 mssg_for_unfiltered_data = fvsp.fvsp_mssg
@@ -104,14 +105,7 @@ def fvspart_series(w, q, c, wue, wipe_if_invalid=False):
     :class:`~fluxpart.containers.FVSPSolution`,
 
     """
-    cov = np.cov([w, q, c])
-    wqc_data = WQCData(
-        wq=cov[0, 1],
-        wc=cov[0, 2],
-        var_q=cov[1, 1],
-        var_c=cov[2, 2],
-        corr_qc=cov[1, 2] / math.sqrt(cov[1, 1] * cov[2, 2]),
-    )
+    wqc_data = _wqc_data(*_wqc_moments(w, q, c))
     return fvspart_interval(wqc_data, wue)
 
 
@@ -188,68 +182,90 @@ def findroot(wqc_data, wue):
         :class:`~fluxpart.containers.RootSoln`
 
     """
+    # Zero variance (e.g., a stuck sensor) would divide by zero below
+    mssg = ""
+    if not wqc_data.var_q > 0:
+        mssg += "var_q<=0; "
+    if not wqc_data.var_c > 0:
+        mssg += "var_c<=0; "
+    if mssg:
+        raise FVSError(mssg)
+
+    # Standard deviations are shared by the assumption checks and root
+    sd_q, sd_c = math.sqrt(wqc_data.var_q), math.sqrt(wqc_data.var_c)
+
     try:
-        _check_fvsp_assumptions(wqc_data, wue)
+        _check_fvsp_assumptions(wqc_data, wue, sd_c / sd_q)
     except FVSError:
         raise
 
-    co2soln_id = None
-    sig_cr, var_cp, corr_cp_cr = np.nan, np.nan, np.nan
-    valid_root = False
+    var_cp, rho_sq, co2soln_id = _findroot_core(
+        wqc_data.var_q,
+        wqc_data.var_c,
+        sd_q,
+        sd_c,
+        wqc_data.wq,
+        wqc_data.wc,
+        wqc_data.corr_qc,
+        wue,
+    )
+    # Degenerate (zero or non-finite) roots would otherwise raise in the
+    # sqrt or divide by zero below
+    if not (var_cp > 0 and rho_sq > 0):
+        return RootSoln(
+            var_cp=var_cp,
+            co2soln_id=co2soln_id,
+            valid_root=False,
+            root_mssg="degenerate root (var_cp or rho_sq <= 0); ",
+        )
+    corr_cp_cr = -math.sqrt(rho_sq)
+    wcr_ov_wcp = flux_ratio(var_cp, corr_cp_cr, wqc_data, "co2", co2soln_id)
+    sig_cr = wcr_ov_wcp * math.sqrt(var_cp) / corr_cp_cr
 
-    var_q, var_c = wqc_data.var_q, wqc_data.var_c
-    sd_q, sd_c = math.sqrt(var_q), math.sqrt(var_c)
-    wq, wc = wqc_data.wq, wqc_data.wc
-    corr_qc = wqc_data.corr_qc
+    return RootSoln(
+        corr_cp_cr=corr_cp_cr,
+        var_cp=var_cp,
+        sig_cr=sig_cr,
+        co2soln_id=co2soln_id,
+        valid_root=True,
+        root_mssg="",
+    )
 
-    # wcwq = wc / wq
-    # scsq = sd_c / sd_q
 
-    # if corr_qc > 0 and ((wue < wcwq < 0) or (0 < wcwq < scsq * corr_qc)):
-    #     co2soln_id = 0 # minus root
-    # if corr_qc < 0:
-    #     if wcwq * corr_qc < scsq < wcwq / corr_qc:
-    #         co2soln_id = 1 if scsq <= corr_qc * wue else 0
+def _findroot_core(var_q, var_c, sd_q, sd_c, wq, wc, corr_qc, wue):
+    """Scalar algebra for findroot.
 
-    co2soln_id = 0 # minus root
-    if corr_qc < 0 and sd_c / sd_q < corr_qc * wue:
-        co2soln_id = 1 # plus root
+    Works on plain floats so that no attribute lookups are made while
+    evaluating the root expressions. Subexpressions shared by the
+    numerators and denominators are computed once.
 
-    # if co2soln_id in (0, 1):
-    if 1:
-        valid_root = True
-        mssg = ""
+    Returns
+    -------
+    (var_cp, rho_sq, co2soln_id) : (float, float, int)
+        Variance of the photosynthetic CO2 concentration, square of
+        corr_cp_cr, and the CO2 root (0 = '-', 1 = '+') of Eq. 13b in
+        [SS08]_. `var_cp` and `rho_sq` are nan if their denominator
+        vanishes.
 
-        numer = -2 * corr_qc * sd_c * sd_q * wq * wc
-        numer += var_c * wq ** 2 + var_q * wc ** 2
-        numer *= -(corr_qc ** 2 - 1) * var_c * var_q * wue ** 2
-        denom = -corr_qc * sd_c * sd_q * (wc + wq * wue)
-        denom += var_c * wq + var_q * wc * wue
-        denom = denom ** 2
+    """
+    co2soln_id = 0  # minus root
+    if corr_qc < 0 and sd_c / sd_q < corr_qc * wue:
+        co2soln_id = 1  # plus root
 
-        var_cp = numer / denom
+    wue_sq = wue * wue
+    cov_qc = corr_qc * sd_c * sd_q
+    vqvc_decorr = -(corr_qc ** 2 - 1) * var_c * var_q
+    flux_term = var_c * wq ** 2 + var_q * wc ** 2 - 2 * cov_qc * wq * wc
 
-        numer = -(corr_qc ** 2 - 1) * var_c * var_q * (wc - wq * wue) ** 2
-        denom = -2 * corr_qc * sd_c * sd_q * wc * wq
-        denom += var_c * wq ** 2 + var_q * wc ** 2
-        denom *= -2 * corr_qc * sd_c * sd_q * wue + var_c + var_q * wue ** 2
+    numer = flux_term * vqvc_decorr * wue_sq
+    denom = (var_c * wq + var_q * wc * wue - cov_qc * (wc + wq * wue)) ** 2
+    var_cp = numer / denom if denom else np.nan
 
-        rho_sq = numer / denom
-        corr_cp_cr = -math.sqrt(rho_sq)
+    numer = vqvc_decorr * (wc - wq * wue) ** 2
+    denom = flux_term * (var_c + var_q * wue_sq - 2 * cov_qc * wue)
+    rho_sq = numer / denom if denom else np.nan
 
-        wcr_ov_wcp = flux_ratio(
-            var_cp, corr_cp_cr, wqc_data, "co2", co2soln_id
-        )
-        sig_cr = wcr_ov_wcp * math.sqrt(var_cp) / corr_cp_cr
-
-    return RootSoln(
-        corr_cp_cr=corr_cp_cr,
-        var_cp=var_cp,
-        sig_cr=sig_cr,
-        co2soln_id=co2soln_id,
-        valid_root=valid_root,
-        root_mssg=mssg,
-    )
+    return var_cp, rho_sq, co2soln_id
 
 
 def flux_ratio(var_cp, corr_cp_cr, wqc_data, ftype, farg):
@@ -310,10 +326,9 @@ def _mass_fluxes(var_cp, corr_cp_cr, wqc_data, wue, co2soln_id):
     )
 
 
-def _check_fvsp_assumptions(qcdat, wue):
+def _check_fvsp_assumptions(qcdat, wue, scsq):
     pqc = qcdat.corr_qc
     wcwq = qcdat.wc / qcdat.wq
-    scsq = np.sqrt(qcdat.var_c / qcdat.var_q)
     mssg = ""
     if wue > wcwq:
         mssg += "wue>Fc/Fq; ".format(wue, wcwq)
@@ -325,30 +340,38 @@ def _check_fvsp_assumptions(qcdat, wue):
         mssg += m.format(wcwq, scsq / pqc)
     if math.isclose(pqc, 0, abs_tol=1e-15):
         mssg += "pqc=0;".format(pqc)
+    if 1 - pqc * pqc <= 1e-15:
+        mssg += "|pqc|=1; "
     if mssg:
         # vals = "(Fc/Fq={:.4}; sigc/sigq={:.4}; W={:.4}; pqc={:.4})"
         # vals = vals.format(wcwq, scsq, wue, pqc)
         raise FVSError(mssg) # + vals)
 
 
+_INVALID_PARTITION_MSSGS = (
+    "Fqt <= 0; ",
+    "Fqe <= 0; ",
+    "Fcp >= 0; ",
+    "Fcr <= 0; ",
+)
+
+
 def _isvalid_partition(flux_components):
     """Test if partitioned flux directions (signs) are valid."""
     fc = flux_components
-    isvalid = True
-    mssg = ""
-    if fc.Fqt <= 0:
-        isvalid = False
-        mssg += "Fqt <= 0; "
-    if fc.Fqe <= 0:
-        isvalid = False
-        mssg += "Fqe <= 0; "
-    if fc.Fcp >= 0:
-        isvalid = False
-        mssg += "Fcp >= 0; "
-    if fc.Fcr <= 0:
-        isvalid = False
-        mssg += "Fcr <= 0; "
-    return isvalid, mssg
+    # One bit per failed test; messages are built only if invalid
+    failed = (
+        (fc.Fqt <= 0)
+        | (fc.Fqe <= 0) << 1
+        | (fc.Fcp >= 0) << 2
+        | (fc.Fcr <= 0) << 3
+    )
+    if not failed:
+        return True, ""
+    mssg = "".join(
+        m for i, m in enumerate(_INVALID_PARTITION_MSSGS) if failed & 1 << i
+    )
+    return False, mssg
 
 
 def _adjust_fluxes(flux_components, wue, Fq_tot, Fc_tot):
@@ -387,12 +410,61 @@ def _adjust_fluxes(flux_components, wue, Fq_tot, Fc_tot):
     return MassFluxes(Fq=Fq_tot, Fqt=Fqt, Fqe=Fqe, Fc=Fc_tot, Fcp=Fcp, Fcr=Fcr)
 
 
+def _cov(x, y):
+    """Sample covariance of two 1D series."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return (x - x.mean()) @ (y - y.mean()) / (x.size - 1)
+
+
+def _wqc_moments(w, q, c):
+    """Second moments of w, q, c needed for partitioning.
+
+    Computes only the five required (co)variances instead of the full
+    covariance matrix.
+
+    Returns
+    -------
+    (cov_w_q, cov_w_c, var_q, var_c, cov_q_c) : tuple of floats
+
+    """
+    # Promote to float64 as np.cov does; float32 sums lose precision
+    w = np.asarray(w, dtype=float)
+    q = np.asarray(q, dtype=float)
+    c = np.asarray(c, dtype=float)
+    dev_w = w - w.mean()
+    dev_q = q - q.mean()
+    dev_c = c - c.mean()
+    n1 = w.size - 1
+    return (
+        dev_w @ dev_q / n1,
+        dev_w @ dev_c / n1,
+        dev_q @ dev_q / n1,
+        dev_c @ dev_c / n1,
+        dev_q @ dev_c / n1,
+    )
+
+
+def _wqc_data(wq, wc, var_q, var_c, cov_qc):
+    """Assemble WQCData from the moments returned by _wqc_moments.
+
+    Moments computed from float32 series are promoted to float64 here
+    because the root algebra is sensitive to rounding.
+
+    """
+    wq, wc, var_q, var_c, cov_qc = map(float, (wq, wc, var_q, var_c, cov_qc))
+    # Zero variance (e.g., a stuck sensor) is left for findroot to reject
+    var_qc = var_q * var_c
+    corr_qc = cov_qc / math.sqrt(var_qc) if var_qc > 0 else np.nan
+    return WQCData(wq=wq, wc=wc, var_q=var_q, var_c=var_c, corr_qc=corr_qc)
+
+
 def _progressive_lowcut(wind, vapor, co2):
     """Apply progressive lowcut filter to wind, vapor, and CO2 series.
 
-    Use wavelet decomposition to yield a sequence of (w, q, c) series
-    in which low frequency (large scale) components are progressively
-    removed from w, q, c.
+    Use wavelet decomposition to yield the (co)variances of a sequence
+    of (w, q, c) series in which low frequency (large scale) components
+    are progressively removed from w, q, c.
 
     Parameters
     ----------
@@ -402,9 +474,11 @@ def _progressive_lowcut(wind, vapor, co2):
 
     Yields
     ------
-    (lc_w, lc_q, lc_c) : tuple of arrays
-        Arrays lc_w, lc_q, and lc_c are low cut (high pass) filtered
-        versions of the passed w,q,c series.
+    (cov_w_q, cov_w_c, var_q, var_c, cov_q_c) : tuple of floats
+        Second moments of the low cut (high pass) filtered versions of
+        the passed w,q,c series. The filtered series themselves are
+        never reconstructed; see
+        :func:`~fluxpart.util.progressive_lowcut_cov`.
 
     Notes
     -----
@@ -412,12 +486,12 @@ def _progressive_lowcut(wind, vapor, co2):
     length is a power of 2.
 
     """
-    max_pow2_len = 2 ** int(np.log2(np.asarray(co2).shape[0]))
+    # Truncate (views) before stacking so only the kept data are copied
+    max_pow2_len = 1 << (len(co2).bit_length() - 1)
     trunc_w = np.asarray(wind)[:max_pow2_len]
     trunc_q = np.asarray(vapor)[:max_pow2_len]
     trunc_c = np.asarray(co2)[:max_pow2_len]
-    lowcut_w = util.progressive_lowcut_series(trunc_w)
-    lowcut_q = util.progressive_lowcut_series(trunc_q)
-    lowcut_c = util.progressive_lowcut_series(trunc_c)
-    for lowcut_series in zip(lowcut_w, lowcut_q, lowcut_c):
-        yield lowcut_series
+    wqc = np.stack((trunc_w, trunc_q, trunc_c))
+    lowcut_cov = util.progressive_lowcut_cov(wqc)
+    for cov in lowcut_cov:
+        yield cov[0, 1], cov[0, 2], cov[1, 1], cov[2, 2], cov[1, 2]
@@ -75,10 +75,18 @@ def chunked_df(dataframes, time_interval):
 
 
 def multifile_read_csv(files, *args, **kwargs):
-    """Buffered pd.read_csv of data split across multiple files."""
+    """Buffered pd.read_csv of data split across multiple files.
+
+    Files given as paths are memory mapped unless `memory_map` is
+    passed explicitly. File-like objects are read as is.
+
+    """
     for file_ in files:
+        kws = kwargs
+        if isinstance(file_, (str, os.PathLike)):
+            kws = {"memory_map": True, **kwargs}
         try:
-            df = pd.read_csv(file_, *args, **kwargs)
+            df = pd.read_csv(file_, *args, **kws)
         except Exception as e:
             mssg = "Skipping file " + str(file_) + " because " + e.args[0]
             warnings.warn(mssg, HFDataReadWarning)
@@ -135,13 +143,23 @@ def ndarray_read_tob1(tobfile, count=-1):
 
 
 def stats2(sarray, names=None):
-    """Calculate means and (co)variances for structured array data."""
+    """Calculate means and (co)variances for structured array data.
+
+    `sarray` may also be a 2D (unstructured) array, in which case its
+    columns are taken to hold the variables listed in `names`.
+
+    """
 
     if names is None:
         names = sarray.dtype.names
     nvar = len(names)
-    data = tuple(sarray[name] for name in names)
-    cov = np.cov(data)
+    if isinstance(sarray, np.ndarray) and sarray.dtype.names is None:
+        data = np.asarray(sarray, dtype=float).T
+    else:
+        data = np.array([sarray[name] for name in names], dtype=float)
+    ave = data.mean(axis=1)
+    dev = data - ave[:, np.newaxis]
+    cov = dev @ dev.T / (data.shape[1] - 1)
     nondiag_cov = list(cov[i, j] for i, j in permutations(range(nvar), 2))
 
     names_ave = list("ave_" + name for name in names)
@@ -150,7 +168,7 @@ def stats2(sarray, names=None):
         "cov_" + n1 + "_" + n2 for n1, n2 in permutations(names, 2)
     )
 
-    out = dict(zip(names_ave, np.mean(data, axis=1)))
+    out = dict(zip(names_ave, ave))
     out.update(zip(names_var, cov.diagonal()))
     out.update(zip(names_cov, nondiag_cov))
 
@@ -260,5 +278,64 @@ def progressive_lowcut_series(series):
         yield lowcut_series
 
 
+def progressive_lowcut_cov(series):
+    """Covariances of progressively lowcut filtered 1D series.
+
+    Yields the sample covariance matrix of the rows of `series` at each
+    step of the sequence generated by :func:`progressive_lowcut_series`,
+    without reconstructing the filtered series. All rows are decomposed
+    together in a single call.
+
+    N.B.: The number of columns is assumed to be a power of 2
+    (does not check!)
+
+    Parameters
+    ----------
+    series : array_like
+        2D array, each row a data series with a length that is a power
+        of 2. float32 data are decomposed in float32 (after removing
+        the mean); other types in float64. The covariances are always
+        accumulated in float64.
+
+    Yields
+    -------
+    cov : array
+        Covariance matrix of the lowcut filtered series, shape
+        (len(series), len(series)).
+
+    Notes
+    -----
+    The haar wavelet transform is orthonormal, so the inner product of
+    two series is equal to the inner product of their wavelet
+    coefficients (Parseval). The lowcut filtered series S - A(j) have
+    zero mean and are composed of the details D(j), ..., D(1). Their
+    covariance is therefore the sum of the detail coefficient inner
+    products for levels j to 1, divided by (N - 1).
+
+    """
+    data = np.asarray(series)
+    if data.dtype == np.float32:
+        # Details are unchanged by removing the mean, which keeps the
+        # float32 transform from rounding fluctuations against a large
+        # offset (e.g., CO2 concentration)
+        ave = data.mean(axis=1, keepdims=True, dtype=float)
+        data = data - ave.astype(np.float32)
+    else:
+        data = data.astype(float, copy=False)
+    nsamp = data.shape[1]
+    wavelet = pywt.Wavelet("haar")
+    nlevel = pywt.dwt_max_level(nsamp, wavelet.dec_len)
+    decomp_coef = pywt.wavedec(data, wavelet=wavelet, level=nlevel, axis=1)
+
+    # Inner products for each detail level, finest level summed first
+    cov = np.zeros((data.shape[0], data.shape[0]))
+    lowcut_cov = []
+    for cDj in reversed(decomp_coef[1:]):
+        cDj = cDj.astype(float, copy=False)
+        cov = cov + cDj @ cDj.T / (nsamp - 1)
+        lowcut_cov.append(cov)
+    yield from reversed(lowcut_cov)
+
+
 if __name__ == "__main__":
     pass
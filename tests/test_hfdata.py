@@ -5,7 +5,7 @@ import numpy as np
 import numpy.testing as npt
 import pandas as pd
 
-from fluxpart.hfdata import HFData, HFDataSource
+from fluxpart.hfdata import HFData, HFDataSource, VAR_NAMES
 from fluxpart.fluxpart import _converter_func, _peektime
 
 TESTDIR = os.path.dirname(os.path.realpath(__file__))
@@ -53,6 +53,32 @@ def test_hfdata_reader():
     npt.assert_allclose(toy.dataframe["T"], 3 * [4])
     npt.assert_allclose(toy.dataframe["P"], 3 * [5])
 
+    # flags with nonzero and mixed type good values
+    toy_data = (
+        "'asdf',0,2,3,4,5,6,7,9,1,ok\n"
+        "'asdf',1,2,3,4,5,6,7,9,1,ok\n"
+        "'asdf',2,2,3,4,5,6,7,9,0,ok\n"
+        "'asdf',3,2,3,4,5,6,7,9,1,ok\n"
+        "'asdf',4,2,3,4,5,6,7,9,1,bad\n"
+        "'asdf',5,2,3,4,5,6,7,9,1,ok\n"
+        "'asdf',6,2,3,4,5,6,7,9,1,ok\n"
+        "'asdf',7,2,3,4,5,6,7,9,1,ok\n"
+    )
+
+    source = HFDataSource(
+        files=[io.BytesIO(toy_data.encode())],
+        filetype="csv",
+        cols=(1, 2, 3, 6, 7, 4, 5),
+        flags=[(9, 1), (10, "ok")],
+        delimiter=",",
+    )
+
+    toy = HFData(next(source.reader(interval=None)))
+    npt.assert_array_equal(toy.dataframe["flag-9"], np.arange(8) == 2)
+    npt.assert_array_equal(toy.dataframe["flag-10"], np.arange(8) == 4)
+    toy.cleanse(rd_tol=0.3, ad_tol=2)
+    npt.assert_allclose(toy.dataframe["u"], [5, 6, 7])
+
     # missing time series data
     toy_data = (
         "foobar baz\n"
@@ -105,6 +131,14 @@ def test_hfdata_reader():
     data = HFData(next(reader))
     assert_1300_read(data)
 
+    source = HFDataSource(
+        files=[fname], filetype="csv", cols=cols, float_dtype=np.float32, **kws
+    )
+    data = HFData(next(source.reader(interval=None)))
+    assert (data.dataframe.loc[:, VAR_NAMES].dtypes == np.float32).all()
+    assert data.dataframe["flag-9"].dtype == bool
+    npt.assert_allclose(data["c"].iloc[0], 659.7584e-6, rtol=1e-6)
+
     kws = dict(
         skiprows=4,
         time_col=0,
@@ -1,6 +1,11 @@
 from types import SimpleNamespace
+import numpy as np
 import numpy.testing as npt
-from fluxpart.partition import fvspart_interval
+from fluxpart.partition import (
+    fvspart_interval,
+    fvspart_progressive,
+    fvspart_series,
+)
 
 
 def test_fvspart_interval():
@@ -75,6 +80,60 @@ def test_fvspart_interval():
     # Previous test used here was wrong
 
 
+def test_degenerate_inputs():
+    # April 7 example from [PRV14], as in test_fvspart_interval
+    wue = -37.158598e-3
+    qcdata = SimpleNamespace(
+        var_q=0.411163e-3 ** 2,
+        var_c=5.182580e-6 ** 2,
+        wq=0.033140e-3,
+        wc=-0.472108e-6,
+        corr_qc=-0.881017,
+    )
+
+    # perfectly (anti)correlated q and c
+    for corr_qc in (1.0, -1.0):
+        data = SimpleNamespace(**{**vars(qcdata), "corr_qc": corr_qc})
+        massfluxes, fvsp = fvspart_interval(data, wue)
+        assert not fvsp.valid_partition
+        assert not fvsp.rootsoln.valid_root
+        assert "|pqc|=1; " in fvsp.fvsp_mssg
+
+    # wc = wq * wue gives a zero root, rho_sq = corr_cp_cr**2 = 0
+    wue = -0.012
+    wq = 0.5e-4
+    data = SimpleNamespace(**{**vars(qcdata), "wq": wq, "wc": wq * wue})
+    massfluxes, fvsp = fvspart_interval(data, wue)
+    assert not fvsp.valid_partition
+    assert not fvsp.rootsoln.valid_root
+    assert "degenerate root" in fvsp.rootsoln.root_mssg
+    assert np.isnan(massfluxes.Fqt)
+
+    # zero variance
+    for var in ("var_q", "var_c"):
+        data = SimpleNamespace(**{**vars(qcdata), var: 0.0, "corr_qc": np.nan})
+        massfluxes, fvsp = fvspart_interval(data, wue)
+        assert not fvsp.valid_partition
+        assert not fvsp.rootsoln.valid_root
+        assert var + "<=0; " in fvsp.fvsp_mssg
+
+
+def test_zero_variance():
+    # stuck vapor sensor
+    rng = np.random.RandomState(0)
+    w = rng.randn(1024)
+    q = np.full(1024, 0.01)
+    c = rng.randn(1024) * 1e-6
+    wue = -7e-3
+
+    for fvspart in (fvspart_series, fvspart_progressive):
+        massfluxes, fvsp = fvspart(w, q, c, wue)
+        assert not fvsp.valid_partition
+        assert not fvsp.rootsoln.valid_root
+        assert "var_q<=0; " in fvsp.fvsp_mssg
+        assert np.isnan(massfluxes.Fqt)
+
+
 def assert_partition(fluxes, fvsp, desired):
     if fvsp.rootsoln.valid_root:
         npt.assert_allclose(fvsp.rootsoln.var_cp, desired.var_cp, atol=1e-14)
@@ -91,3 +150,5 @@ def assert_partition(fluxes, fvsp, desired):
 
 if __name__ == "__main__":
     test_fvspart_interval()
+    test_degenerate_inputs()
+    test_zero_variance()
@@ -10,6 +10,8 @@ from fluxpart.util import (
     stats2,
     multifile_read_csv,
     chunked_df,
+    progressive_lowcut_series,
+    progressive_lowcut_cov,
     HFDataReadWarning,
 )
 
@@ -54,6 +56,14 @@ def test_stats2():
     assert not hasattr(ans, "cov_v1_v2")
     assert not hasattr(ans, "cov_v2_v1")
 
+    arr2d = np.genfromtxt(io.BytesIO(data.encode()))
+    ans = stats2(arr2d, names=("v0", "v1", "v2"))
+
+    npt.assert_allclose(ans.ave_v1, 24 / 5)
+    npt.assert_allclose(ans.var_v1, 97 / 10)
+    npt.assert_allclose(ans.cov_v0_v2, 2)
+    npt.assert_allclose(ans.cov_v2_v1, ans.cov_v1_v2)
+
 
 def test_mulitifile_read_csv():
     file1 = io.BytesIO("1,2,3\n4,5,6\n7,8,9\n10,11,12".encode())
@@ -107,6 +117,26 @@ def test_chunked_df():
     assert df.index[-1] == pd.to_datetime("2000-01-03 01:00:00")
 
 
+def test_progressive_lowcut_cov():
+    data = np.random.rand(3, 256)
+    lowcut_series = zip(*(progressive_lowcut_series(d) for d in data))
+    lowcut_cov = progressive_lowcut_cov(data)
+    for cnt, (series, cov) in enumerate(zip(lowcut_series, lowcut_cov)):
+        npt.assert_allclose(cov, np.cov(series))
+    assert cnt == 7
+
+
+def test_progressive_lowcut_cov_float32():
+    # Fluctuations small relative to the mean, as for CO2 in kg/m^3
+    rng = np.random.RandomState(0)
+    scale = np.array([[1], [1e-2], [1e-5]])
+    offset = np.array([[0], [1e-2], [7e-4]])
+    data = (offset + scale * rng.randn(3, 1024)).astype(np.float32)
+    cov = next(progressive_lowcut_cov(data))
+    assert cov.dtype == np.float64
+    npt.assert_allclose(cov, np.cov(data, dtype=float), rtol=1e-5)
+
+
 def test_read_warning():
     # not working
     # see: https://bugs.python.org/issue29620
@@ -127,4 +157,6 @@ if __name__ == "__main__":
     test_stats2()
     test_mulitifile_read_csv()
     test_chunked_df()
+    test_progressive_lowcut_cov()
+    test_progressive_lowcut_cov_float32()
     # test_read_warning()